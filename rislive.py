@@ -3,22 +3,38 @@
 
 import argparse
 import asyncio
+import functools
 import ipaddress
-import json
 import logging
-import re
+import random
 import signal
+import socket
 import ssl
+import sys
 from typing import Any, Dict, Optional
 
+import orjson
+from websockets.exceptions import ConnectionClosedOK
 from websockets.legacy.client import WebSocketClientProtocol, connect
 
+# Number of messages to coalesce into a single stdout write.
+STDOUT_BATCH_SIZE = 64
+
+# Upper bound on messages buffered between the receive loop and the writer task.
+STDOUT_QUEUE_SIZE = 4096
+
+# Shared SSL context; building one loads the system CA bundle, so do it once
+# at import time instead of on every (re)connect.
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
 
 def validate_rrc(value: str) -> list:
     """Validate RRC host format."""
     rrc_list = [rrc.strip() for rrc in value.split(",")]
     for rrc in rrc_list:
-        if not re.match(r"^rrc\d{2}$", rrc):
+        if not (len(rrc) == 5 and rrc.startswith("rrc") and rrc[3:].isdigit()):
             raise argparse.ArgumentTypeError(f"Invalid RRC format '{rrc}'. Must be in format 'rrcXX' where X is a digit")
     return rrc_list
 
@@ -26,9 +42,9 @@ def validate_rrc(value: str) -> list:
 def validate_peer(value: str) -> str:
     """Validate peer IP address."""
     try:
-        ipaddress.ip_address(value)
+        socket.inet_pton(socket.AF_INET6 if ":" in value else socket.AF_INET, value)
         return value
-    except ValueError as exc:
+    except OSError as exc:
         raise argparse.ArgumentTypeError("Invalid IP address format") from exc
 
 
@@ -38,18 +54,19 @@ def validate_aspath(value: str) -> list:
     validated_paths = []
     for path in path_list:
         clean_path = path.strip("^$")
-        try:
-            for asn in clean_path.split(","):
-                if asn:
-                    asn_int = int(asn)
-                    if not (0 <= asn_int <= 4294967295):
-                        raise ValueError
-            validated_paths.append(path)
-        except ValueError as exc:
-            raise argparse.ArgumentTypeError(f"Invalid AS path format in '{path}'. Must be comma-separated ASNs") from exc
+        for asn in clean_path.split(","):
+            if asn and (not (asn.isascii() and asn.isdigit()) or len(asn) > 10 or int(asn) > 4294967295):
+                raise argparse.ArgumentTypeError(f"Invalid AS path format in '{path}'. Must be comma-separated ASNs")
+        validated_paths.append(path)
     return validated_paths
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_net(value: str) -> ipaddress.IPv4Network | ipaddress.IPv6Network:
+    """Parse a prefix with the general ipaddress machinery, memoized by string."""
+    return ipaddress.ip_network(value, strict=False)
+
+
 def validate_prefix(value: str) -> list:
     """Validate network prefix."""
     prefix_list = [prefix.strip() for prefix in value.split(",")]
@@ -57,11 +74,20 @@ def validate_prefix(value: str) -> list:
     for prefix in prefix_list:
         if "/" not in prefix:
             raise argparse.ArgumentTypeError(f"Network prefix '{prefix}' must include mask in CIDR notation (e.g. 192.0.2.0/24 or 2001:db8::/32)")
+        address, _, mask = prefix.partition("/")
+        family, max_mask = (socket.AF_INET6, 128) if ":" in address else (socket.AF_INET, 32)
         try:
-            ipaddress.ip_network(prefix, strict=False)
+            socket.inet_pton(family, address)
+            if not (mask.isascii() and mask.isdigit()) or int(mask) > max_mask:
+                raise OSError
             validated_prefixes.append(prefix)
-        except ValueError as exc:
-            raise argparse.ArgumentTypeError(f"Invalid network prefix format: {prefix}") from exc
+        except OSError:
+            # Fall back to the general parser for unusual formats.
+            try:
+                _parse_net(prefix)
+                validated_prefixes.append(prefix)
+            except ValueError as exc:
+                raise argparse.ArgumentTypeError(f"Invalid network prefix format: {prefix}") from exc
     return validated_prefixes
 
 
@@ -77,48 +103,107 @@ class RipeRisStreamer:
         """
         self._options = options
         self._ws: Optional[WebSocketClientProtocol] = None
-        self._sslcontext = ssl.create_default_context()
-        self._sslcontext.check_hostname = False
-        self._sslcontext.verify_mode = ssl.CERT_NONE
+        self._sslcontext = _SSL_CTX
+        self._out_q: asyncio.Queue = asyncio.Queue(maxsize=STDOUT_QUEUE_SIZE)
+        self._connected = False
+
+    @property
+    def connected(self) -> bool:
+        """Whether the last start_streaming call got as far as subscribing."""
+        return self._connected
 
     # [Previous methods remain unchanged]
     async def start_streaming(self) -> None:
         """Start streaming data from RIPE RIS Live."""
         uri = "wss://ris-live.ripe.net/v1/ws/?client=RipeRisStreamer"
         logging.debug("Creating websocket connection...")
-        async with connect(uri, ssl=self._sslcontext) as websocket:
+        self._connected = False
+        async with connect(
+            uri,
+            ssl=self._sslcontext,
+            compression=None,
+            max_size=2**22,
+            max_queue=1024,
+            read_limit=2**20,
+            write_limit=2**20,
+        ) as websocket:
             self._ws = websocket
             logging.debug("Sending RIS parameters...")
-            logging.debug("RIS parameters: %s ", {self._get_ris_params()})
-            await websocket.send(self._get_ris_params())
+            ris_params = self._get_ris_params()
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("RIS parameters: %s", ris_params)
+            await websocket.send(ris_params)
+            self._connected = True
             print("Listening...")
             logging.debug("Starting the reception loop...")
-            async for message in websocket:
+            writer = asyncio.create_task(self._drain_stdout())
+            stream_task = asyncio.current_task()
+
+            def on_writer_done(task: asyncio.Task) -> None:
+                # Surface writer failures (e.g. BrokenPipeError when stdout is a
+                # closed pipe) in the receive loop instead of hanging on a full queue.
+                if not task.cancelled() and task.exception() is not None and stream_task is not None:
+                    stream_task.cancel()
+
+            writer.add_done_callback(on_writer_done)
+            recv = websocket.recv
+            put = self._out_q.put
+            try:
+                while True:
+                    try:
+                        message = await recv()
+                    except ConnectionClosedOK:
+                        break
+                    await put(message if isinstance(message, bytes) else message.encode())
+            finally:
+                writer.cancel()
                 try:
-                    print(message)
-                except ValueError as e:
-                    print(f"Error processing message: {str(e)}")
+                    await writer
+                except asyncio.CancelledError:
+                    pass
+                leftover = []
+                while not self._out_q.empty():
+                    leftover.append(self._out_q.get_nowait())
+                if leftover:
+                    sys.stdout.buffer.write(b"\n".join(leftover) + b"\n")
+                sys.stdout.buffer.flush()
+
+    async def _drain_stdout(self) -> None:
+        """Drain queued messages to stdout in coalesced batches."""
+        out = sys.stdout.buffer
+        queue = self._out_q
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty() and len(batch) < STDOUT_BATCH_SIZE:
+                batch.append(queue.get_nowait())
+            out.write(b"\n".join(batch) + b"\n")
+            out.flush()
 
     def _get_ris_params(self) -> str:
         """Generate RIS parameters based on command-line options."""
+        opts = self._options
         params: Dict[str, Any] = {
-            "socketOptions": {"includeRaw": bool(self._options.include_raw)},
-            "moreSpecific": bool(self._options.more_specific),
-            "lessSpecific": bool(self._options.less_specific),
-            "autoReconnect": not self._options.disable_auto_reconnect,
-        }
-
-        optional_params = {
-            "host": self._options.filter_host[0] if self._options.filter_host else None,
-            "type": self._options.filter_type,
-            "require": (self._options.filter_key[0] if self._options.filter_key else None),
-            "peer": self._options.filter_peer,
-            "path": (",".join(self._options.filter_aspath) if self._options.filter_aspath else None),
-            "prefix": (self._options.filter_prefix if self._options.filter_prefix else None),
+            "socketOptions": {"includeRaw": bool(opts.include_raw)},
+            "moreSpecific": bool(opts.more_specific),
+            "lessSpecific": bool(opts.less_specific),
+            "autoReconnect": not opts.disable_auto_reconnect,
         }
 
-        params.update({k: v for k, v in optional_params.items() if v is not None})
-        return json.dumps({"type": "ris_subscribe", "data": params})
+        if opts.filter_host:
+            params["host"] = opts.filter_host[0]
+        if opts.filter_type is not None:
+            params["type"] = opts.filter_type
+        if opts.filter_key:
+            params["require"] = opts.filter_key[0]
+        if opts.filter_peer is not None:
+            params["peer"] = opts.filter_peer
+        if opts.filter_aspath:
+            params["path"] = opts.filter_aspath[0] if len(opts.filter_aspath) == 1 else ",".join(opts.filter_aspath)
+        if opts.filter_prefix:
+            params["prefix"] = opts.filter_prefix
+        # RIS Live speaks JSON over text frames; keep the payload a str so the
+        # subscribe message is not sent as a binary frame.
+        return orjson.dumps({"type": "ris_subscribe", "data": params}).decode()
 
     async def disconnect(self) -> bool:
         """Disconnect from the websocket."""
@@ -237,24 +322,42 @@ async def main() -> int:
         for task in tasks:
             task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
-        asyncio.get_event_loop().stop()
+        loop.stop()
+
+    def on_sigint() -> None:
+        asyncio.create_task(shutdown())
 
-    loop = asyncio.get_event_loop()
-    loop.add_signal_handler(signal.SIGINT, lambda: asyncio.create_task(shutdown()))
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, on_sigint)
 
+    reconnect_delay = 0.5
     try:
         while not args.disable_auto_reconnect:
             try:
                 await streamer.start_streaming()
+                reconnect_delay = 0.5
             except asyncio.CancelledError:
                 break
             except ConnectionError as e:
                 print(f"Streamer encountered an error: {str(e)}")
+                if streamer.connected:
+                    # The connection was established before failing, so this is
+                    # not part of an ongoing outage; start backoff from scratch.
+                    reconnect_delay = 0.5
+                # Exponential backoff with jitter so restarts do not hammer the server.
+                await asyncio.sleep(reconnect_delay * random.uniform(0.5, 1.0))
+                reconnect_delay = min(reconnect_delay * 2, 30.0)
     except asyncio.CancelledError:
         pass
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     try:
         asyncio.run(main())
     except KeyboardInterrupt: